@@ -1,4 +1,10 @@
 __version__ = "0.0.4"
 
-from .core import Comparison
-from .core import Compare
+
+def __getattr__(name):
+    # Lazy imports: pandas and datacompy are only loaded once the comparison API is used
+    if name in ("Comparison", "Compare"):
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
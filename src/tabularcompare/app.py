@@ -1,12 +1,6 @@
 import os
 import click
-from .utils import (
-    load_from_file,
-    report_to_xlsx,
-    report_to_txt,
-    report_to_html,
-)
-from .core import Comparison
+from concurrent.futures import ThreadPoolExecutor
 
 
 @click.command()
@@ -88,6 +82,12 @@ from .core import Comparison
 @click.option(
     "-e", "--encoding", default=None, help="Character encoding to read df1 and df2."
 )
+@click.option(
+    "-pa",
+    "--pyarrow",
+    is_flag=True,
+    help="Flag to parse .csv files with the multi-threaded pyarrow engine, when installed.",
+)
 @click.option("-v", "--verbose", is_flag=True, help="Verbosity.")
 def cli(
     df1,
@@ -106,16 +106,32 @@ def cli(
     only_deltas,
     output,
     encoding,
+    pyarrow,
     verbose,
 ):
+    # Deferred imports: pandas and datacompy are not loaded for --help or usage errors
+    from .utils import (
+        load_from_file,
+        report_to_xlsx,
+        report_to_txt,
+        report_to_html,
+    )
+    from .core import Comparison
+
     if verbose:
         print(f"Reading {df1_name} from {os.path.abspath(df1)}...")
-    df1_path = df1
-    df1 = load_from_file(df1, encoding)
-    if verbose:
         print(f"Reading {df2_name} from {os.path.abspath(df2)}...")
+    df1_path = df1
     df2_path = df2
-    df2 = load_from_file(df2, encoding)
+    # Overlap both reads, pandas parsers release the GIL
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        df1_future = executor.submit(load_from_file, df1, encoding, pyarrow)
+        df2_future = executor.submit(load_from_file, df2, encoding, pyarrow)
+    # Loading errors are echoed by load_from_file
+    if df1_future.exception() or df2_future.exception():
+        quit(-1)
+    df1 = df1_future.result()
+    df2 = df2_future.result()
 
     if df1.equals(df2) and verbose:
         print(
@@ -155,16 +171,25 @@ def cli(
             ignore_case=case_insensitive,
             cast_column_names_lower=cast_lowercase,
         )
+        # Run the whole comparison before the concurrent reports, which only read its results
+        comparison.diverging_subset()
+        comparison.intersect_rows()
     except Exception as e:
         click.echo(click.style(f"{type(e).__name__}: {e}", fg="red"))
         quit(-1)
 
-    # Reporting
-    report_to_xlsx(comparison, only_deltas, verbose, output)
-    if txt:
-        report_to_txt(comparison, verbose, output)
-    if html:
-        report_to_html(comparison, verbose, output)
+    # Reporting, independent report files are written concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        reports = [
+            executor.submit(report_to_xlsx, comparison, only_deltas, verbose, output)
+        ]
+        if txt:
+            reports.append(executor.submit(report_to_txt, comparison, verbose, output))
+        if html:
+            reports.append(executor.submit(report_to_html, comparison, verbose, output))
+    # Report errors are echoed by each report, exit once if any of them failed
+    if any(report.exception() for report in reports):
+        quit(-1)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,231 @@
 import os
-import math
 import warnings
+import functools
+import numpy as np
 import pandas as pd
 from typing import Union
 from datacompy import Compare
-from ordered_set import OrderedSet
-from pretty_html_table import build_table
+
+# Minimum column length to pay for importing Numba, smaller columns are checked with NumPy
+_NUMBA_MIN_SIZE = 1_000_000
+
+# Diverging subset table style (grey_dark theme)
+_HTML_TABLE_STYLE = """
+table.tabularcompare th, table.tabularcompare td {
+    font-family: Monospace; font-size: 12px; text-align: left; padding: 0px 20px 0px 0px;
+}
+table.tabularcompare th {
+    background-color: #808080; color: #FFFFFF; border-bottom: 2px solid #808080;
+}
+table.tabularcompare tbody tr:nth-child(odd) td {
+    background-color: #EDEDED;
+}
+table.tabularcompare tbody tr:nth-child(even) td {
+    background-color: white; color: black;
+}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _integer_valued_kernel():
+    """
+    Compiles a Numba kernel checking for integer and NaN values in a single pass over a float array.
+    Returns None when Numba is not installed.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def all_integer_or_nan(values):
+        for value in values:
+            if value == value and not (np.isfinite(value) and np.floor(value) == value):
+                return False
+        return True
+
+    return all_integer_or_nan
+
+
+def _is_integer_valued(column: pd.Series) -> bool:
+    """
+    Checks if a float column holds only integer and NaN values.
+    Uses a Numba kernel on large columns when available, falling back to vectorized NumPy operations.
+    """
+    if pd.api.types.is_extension_array_dtype(column):
+        return False
+    values = column.to_numpy()
+    kernel = None
+    # Numba has no float16 support, those columns take the NumPy path
+    if len(values) >= _NUMBA_MIN_SIZE and values.dtype in (np.float32, np.float64):
+        kernel = _integer_valued_kernel()
+    if kernel is not None:
+        return bool(kernel(values))
+    return bool(
+        np.all(np.isnan(values) | (np.isfinite(values) & (np.floor(values) == values)))
+    )
+
+
+def _to_nullable_int(column: pd.Series) -> pd.Series:
+    """
+    Casts an integer-valued float column to nullable Int64.
+    Builds the IntegerArray from the NaN mask directly, skipping the integer re-validation of astype("Int64").
+    """
+    values = column.to_numpy()
+    if (np.abs(values) >= 2**63).any():
+        # Out of int64 range, let pandas raise
+        return column.astype("Int64")
+    mask = np.isnan(values)
+    return pd.Series(
+        pd.arrays.IntegerArray(np.where(mask, 0, values).astype(np.int64), mask),
+        index=column.index,
+        name=column.name,
+    )
+
+
+def _to_str_array(column: pd.Series) -> np.ndarray:
+    """
+    Casts a column to a NumPy object array of strings, rendering missing values (nan, <NA>) as empty strings.
+    Missing values are located with isna, so literal "nan" and "<NA>" strings are kept.
+    """
+    values = column.astype(str).to_numpy()
+    values[column.isna().to_numpy() & ((values == "nan") | (values == "<NA>"))] = ""
+    return values
+
+
+def _html_table(df: pd.DataFrame, col_widths: list) -> str:
+    """
+    Renders a DataFrame as a styled HTML table with a single DataFrame.to_html call.
+    Column widths are set with one CSS rule per column.
+    Returns an empty string for an empty DataFrame, as pretty_html_table.build_table did.
+    """
+    if df.empty:
+        return ""
+    width_rules = "".join(
+        f"table.tabularcompare th:nth-child({i}), table.tabularcompare td:nth-child({i}) "
+        f"{{ width: {width}; }}\n"
+        for i, width in enumerate(col_widths, start=1)
+    )
+    return f"<style>{_HTML_TABLE_STYLE}{width_rules}</style>" + df.to_html(
+        index=False, na_rep="", border=0, classes="tabularcompare"
+    )
+
+
+def _ordered_intersect(a, b) -> list:
+    """
+    Returns the items of a also present in b, in the order of a.
+    """
+    b_set = set(b)
+    return [item for item in a if item in b_set]
+
+
+class _Compare(Compare):
+    """
+    datacompy.Compare with a cheaper duplicate join keys check.
+    Flags duplicates with DataFrame.duplicated instead of materializing a deduplicated copy of each DataFrame.
+    """
+
+    def _validate_dataframe(self, index, cast_column_names_lower=True):
+        dataframe = getattr(self, index)
+        if not isinstance(dataframe, pd.DataFrame):
+            raise TypeError(f"{index} must be a pandas DataFrame")
+
+        if cast_column_names_lower:
+            dataframe.columns = [str(col).lower() for col in dataframe.columns]
+        else:
+            dataframe.columns = [str(col) for col in dataframe.columns]
+        if not set(self.join_columns).issubset(set(dataframe.columns)):
+            raise ValueError(f"{index} must have all columns from join_columns")
+
+        if len(set(dataframe.columns)) < len(dataframe.columns):
+            raise ValueError(f"{index} must have unique column names")
+
+        if self.on_index:
+            if dataframe.index.has_duplicates:
+                self._any_dupes = True
+        elif dataframe.duplicated(subset=self.join_columns).any():
+            self._any_dupes = True
+
+
+class _IndexedCompare(_Compare):
+    """
+    datacompy.Compare with an indexer-based join for unique join columns.
+    Aligns df1 and df2 on their join keys and takes only the matching rows, instead of materializing
+    and filtering the full outer join. Row labels follow the outer join positions, as in datacompy.Compare.
+    Falls back to datacompy.Compare's outer join on index joins, duplicated or null join keys,
+    mismatched join column dtypes, and when ignore_spaces is set.
+    A single numeric join column sorted in both DataFrames is matched with a binary search instead of a hash lookup.
+    """
+
+    def _join_keys(self, dataframe: pd.DataFrame) -> pd.Index:
+        if len(self.join_columns) == 1:
+            return pd.Index(dataframe[self.join_columns[0]])
+        return pd.MultiIndex.from_frame(dataframe[self.join_columns])
+
+    def _df2_positions(self) -> np.ndarray:
+        """
+        Positions of the df1 join keys in df2, -1 where missing.
+        """
+        if len(self.join_columns) == 1:
+            df1_keys = self.df1[self.join_columns[0]]
+            df2_keys = self.df2[self.join_columns[0]]
+            if (
+                isinstance(df1_keys.dtype, np.dtype)
+                and df1_keys.dtype.kind in "iufM"
+                and len(df2_keys) > 0
+                and df1_keys.is_monotonic_increasing
+                and df2_keys.is_monotonic_increasing
+            ):
+                df1_values = df1_keys.to_numpy()
+                df2_values = df2_keys.to_numpy()
+                positions = np.searchsorted(df2_values, df1_values)
+                positions[positions == len(df2_values)] = 0
+                return np.where(df2_values[positions] == df1_values, positions, -1)
+        return self._join_keys(self.df2).get_indexer(self._join_keys(self.df1))
+
+    def _dataframe_merge(self, ignore_spaces):
+        if (
+            self.on_index
+            or self._any_dupes
+            or ignore_spaces
+            or any(
+                self.df1[col].dtype != self.df2[col].dtype for col in self.join_columns
+            )
+            or self.df1[self.join_columns].isna().any(axis=None)
+            or self.df2[self.join_columns].isna().any(axis=None)
+        ):
+            return super()._dataframe_merge(ignore_spaces)
+
+        df2_positions = self._df2_positions()
+        df1_matched = df2_positions >= 0
+        df2_matched = np.zeros(len(self.df2), dtype=bool)
+        df2_matched[df2_positions[df1_matched]] = True
+
+        self.df1_unq_rows = self.df1.take(np.flatnonzero(~df1_matched))
+        self.df1_unq_rows.index = np.flatnonzero(~df1_matched)
+        self.df2_unq_rows = self.df2.take(np.flatnonzero(~df2_matched))
+        self.df2_unq_rows.index = len(self.df1) + np.arange(len(self.df2_unq_rows))
+
+        # Intersect rows laid out as the outer join: df1 columns, then df2 non-join columns
+        df1_rows = self.df1.take(np.flatnonzero(df1_matched))
+        df1_rows.columns = [
+            col + "_df1"
+            if col in self.df2.columns and col not in self.join_columns
+            else col
+            for col in self.df1.columns
+        ]
+        df2_rows = self.df2.take(df2_positions[df1_matched]).drop(
+            columns=self.join_columns
+        )
+        df2_rows.columns = [
+            col + "_df2" if col in self.df1.columns else col for col in df2_rows.columns
+        ]
+        df1_rows.index = df2_rows.index = np.flatnonzero(df1_matched)
+        self.intersect_rows = pd.concat([df1_rows, df2_rows], axis=1)
+        self.intersect_rows["_merge"] = pd.Categorical(
+            ["both"] * len(self.intersect_rows),
+            categories=["left_only", "right_only", "both"],
+        )
 
 
 class Comparison:
@@ -27,6 +247,8 @@ class Comparison:
         rel_tol (float, optional): Relative tolerance between two numeric values.
         cast_column_names_lower (bool, optional): If True, column names will be converted to lowercase before comparison.
         encoding (str, optional): Encoding to parse txt and HTML reports. Default = "utf-8".
+        fast_path (bool, optional): If True, matches rows on unique join_columns with an index lookup
+            instead of datacompy's full outer join. Intersect and unique rows keep their original dtypes. Default = False.
 
     Attributes:
         df1 (pd.DataFrame): The first DataFrame used in the comparison.
@@ -45,7 +267,7 @@ class Comparison:
         df2_unq_columns: Returns a pandas DataFrame with join_columns (or index, if join_columns = None) and columns present only in df2.
         df1_unq_rows: Returns a pandas DataFrame with the df1 subset that is unique to df1.
         df2_unq_rows: Returns a pandas DataFrame with the df2 subset that is unique to df2.
-        intersect_columns: Returns a set of columns present in both df1 and df2.
+        intersect_columns: Returns a list of columns present in both df1 and df2.
         report_to_txt: Saves datacompy.Compare report in txt.
         report_to_html: Saves datacompy.Compare report in HTML.
         report_to_xlsx: Saves a .xlsx report with the diverging subset, unique columns, and unique rows to df1 and df2.
@@ -70,18 +292,21 @@ class Comparison:
         ignore_case: bool = False,
         cast_column_names_lower: bool = False,
         encoding: str = "utf-8",
+        fast_path: bool = False,
     ) -> None:
-        self.df1 = df1
-        self.df2 = df2
+        # Shallow copies, so preprocessing and datacompy.Compare don't mutate the caller's DataFrames
+        self.df1 = df1.copy(deep=False)
+        self.df2 = df2.copy(deep=False)
         self.ignore_columns = ignore_columns
         if self.ignore_columns:
             if isinstance(ignore_columns, str):
                 self.ignore_columns = [ignore_columns]
-            try:
-                self.df1.drop(columns=self.ignore_columns, inplace=True)
-                self.df2.drop(columns=self.ignore_columns, inplace=True)
-            except KeyError:
-                pass
+            self.df1 = self.df1.drop(
+                columns=[col for col in self.ignore_columns if col in self.df1.columns]
+            )
+            self.df2 = self.df2.drop(
+                columns=[col for col in self.ignore_columns if col in self.df2.columns]
+            )
         if isinstance(join_columns, str):
             self.join_columns = [join_columns]
         else:
@@ -95,13 +320,21 @@ class Comparison:
         self._ignore_spaces = ignore_spaces
         self._ignore_case = ignore_case
         self._cast_column_names_lower = cast_column_names_lower
+        self._fast_path = fast_path
         self._df1_intersect_cols = []
         self._df2_intersect_cols = []
         self._intersect_match_cols = []
+        self._comparison_results = None
+        self._diverging_subset_df = None
+        self._df1_unq_rows_df = None
+        self._df2_unq_rows_df = None
+        self._df1_unq_columns_df = None
+        self._df2_unq_columns_df = None
+        self._is_identical = None
         self._handle_join()
         self._preprocess_int_missing()
-        self._compare()
-        self._enhanced_compare()
+        self._cast_column_names()
+        self._validate()
     
     # join_columns and on_index handling
     def _handle_join(self):
@@ -113,28 +346,61 @@ class Comparison:
         """
         Preprocess int columns with null values typecasting them to nullable integer Int64.
         """
-        intersect_columns = OrderedSet(self.df1.columns) & OrderedSet(self.df2.columns)
-        if self.join_columns:
-            intersect_columns = list(
-                filter(lambda x: x not in self.join_columns, intersect_columns)
-            )
-        for col in intersect_columns:
-            if pd.api.types.is_float_dtype(self.df1[col]):
+        df1_float_columns = set(self.df1.select_dtypes(include="floating").columns)
+        df2_float_columns = set(self.df2.select_dtypes(include="floating").columns)
+        join_columns = set(self.join_columns or [])
+        float_columns = [
+            col
+            for col in _ordered_intersect(self.df1.columns, self.df2.columns)
+            if col not in join_columns
+            and (col in df1_float_columns or col in df2_float_columns)
+        ]
+        for col in float_columns:
+            if col in df1_float_columns:
                 # Check if int column of df1 has only integer and NaN values
-                if all(x.is_integer() for x in self.df1[col] if not math.isnan(x)):
-                    self.df1[col] = self.df1[col].astype("Int64")
-            if pd.api.types.is_float_dtype(self.df2[col]):
+                if _is_integer_valued(self.df1[col]):
+                    self.df1[col] = _to_nullable_int(self.df1[col])
+            if col in df2_float_columns:
                 # Check if int column of df2 has only integer and NaN values
-                if all(x.is_integer() for x in self.df2[col] if not math.isnan(x)):
-                    self.df2[col] = self.df2[col].astype("Int64")
+                if _is_integer_valued(self.df2[col]):
+                    self.df2[col] = _to_nullable_int(self.df2[col])
+
+    def _cast_column_names(self):
+        """
+        Casts column names the same way datacompy.Compare does,
+        so intersect_columns agrees before and after the comparison is run.
+        """
+        for df in (self.df1, self.df2):
+            df.columns = [
+                str(col).lower() if self._cast_column_names_lower else str(col)
+                for col in df.columns
+            ]
 
-    def _compare(self) -> None:
+    def _validate(self):
+        """
+        Validates join_columns and column names the same way datacompy.Compare does,
+        so invalid input raises on construction instead of when the comparison is first run.
+        """
+        if self._on_index and self.join_columns is not None:
+            raise Exception("Only provide on_index or join_columns")
+        join_columns = [
+            str(col).lower() if self._cast_column_names_lower else str(col)
+            for col in self.join_columns or []
+        ]
+        for index, df in (("df1", self.df1), ("df2", self.df2)):
+            if not set(join_columns).issubset(set(df.columns)):
+                raise ValueError(f"{index} must have all columns from join_columns")
+            if len(set(df.columns)) < len(df.columns):
+                raise ValueError(f"{index} must have unique column names")
+
+    def _compare(self, df1: pd.DataFrame, df2: pd.DataFrame) -> None:
         """
         datacompy.Compare object.
         """
-        comparison_results = Compare(
-            df1=self.df1,
-            df2=self.df2,
+        compare = _IndexedCompare if self._fast_path else _Compare
+        comparison_results = compare(
+            df1=df1,
+            df2=df2,
             join_columns=self.join_columns,
             on_index=self._on_index,
             abs_tol=self._abs_tol,
@@ -160,30 +426,41 @@ class Comparison:
         else:
             join_columns = [""]
 
+        # Boolean match matrix of compared columns, reduced once per axis
+        intersect_rows = self._comparison_results.intersect_rows
+        # Outer join column names of each compared column: (df1, df2, match)
+        compare_columns = {
+            col: (col + "_df1", col + "_df2", col + "_match")
+            for col in self.intersect_columns()
+            if col not in join_columns
+        }
+        match_matrix = intersect_rows[
+            [match_col for _, _, match_col in compare_columns.values()]
+        ].to_numpy(dtype=bool, na_value=False)
+        diverging_columns = ~match_matrix.all(axis=0)
+        df1_int_columns = set(self.df1.select_dtypes(include="integer").columns)
+        df2_int_columns = set(self.df2.select_dtypes(include="integer").columns)
+
         # Intersect of diverging columns from df1 to df2
-        for col in self._comparison_results.intersect_columns():
-            if (col not in join_columns) and (
-                sum(~self._comparison_results.intersect_rows[col + "_match"]) > 0
-            ):
-                self._df1_intersect_cols.append(col + "_df1")
-                self._df2_intersect_cols.append(col + "_df2")
-                self._intersect_match_cols.append(col + "_match")
+        diverging_names = []
+        for (col, (df1_col, df2_col, match_col)), is_diverging in zip(
+            compare_columns.items(), diverging_columns
+        ):
+            if is_diverging:
+                diverging_names.append(col)
+                self._df1_intersect_cols.append(df1_col)
+                self._df2_intersect_cols.append(df2_col)
+                self._intersect_match_cols.append(match_col)
                 # Typecasting int columns back to Int64 columns (after outer_join from datacompy.Compare)
-                if pd.api.types.is_integer_dtype(self.df1[col]):
-                    self._comparison_results.intersect_rows[
-                        col + "_df1"
-                    ] = self._comparison_results.intersect_rows[col + "_df1"].astype(
-                        "Int64"
-                    )
-                if pd.api.types.is_integer_dtype(self.df2[col]):
-                    self._comparison_results.intersect_rows[
-                        col + "_df2"
-                    ] = self._comparison_results.intersect_rows[col + "_df2"].astype(
-                        "Int64"
-                    )
-        self._intersect_set = list(
-            set(self._df1_intersect_cols).union(set(self._df2_intersect_cols))
-        )
+                if col in df1_int_columns and intersect_rows[df1_col].dtype != "Int64":
+                    intersect_rows[df1_col] = intersect_rows[df1_col].astype("Int64")
+                if col in df2_int_columns and intersect_rows[df2_col].dtype != "Int64":
+                    intersect_rows[df2_col] = intersect_rows[df2_col].astype("Int64")
+        self._intersect_set = [
+            col
+            for cols in zip(self._df1_intersect_cols, self._df2_intersect_cols)
+            for col in cols
+        ]
         if self.join_columns:
             self._intersect_cols = (
                 self.join_columns + self._intersect_set + self._intersect_match_cols
@@ -192,58 +469,106 @@ class Comparison:
             self._intersect_cols = self._intersect_set + self._intersect_match_cols
 
         # Diverging subset
-        diverging_subset = self._comparison_results.intersect_rows.loc[
-            (~self._comparison_results.intersect_rows[self._intersect_match_cols]).sum(
-                axis=1
-            )
-            > 0,
-            self._intersect_cols,
-        ]
-        for col in self._df1_intersect_cols:
-            diverging_subset[col[:-4]] = (
-                "{"
-                + diverging_subset.loc[
-                    ~diverging_subset[col[:-4] + "_match"], col
-                ].astype(str)
-                + "} --> {"
-                + diverging_subset.loc[
-                    ~diverging_subset[col[:-4] + "_match"], col[:-4] + "_df2"
-                ].astype(str)
-                + "}"
-            )
-            diverging_subset[col[:-4]] = diverging_subset[col[:-4]].str.replace(
-                "{nan}", "{}", regex=False
-            )
-            diverging_subset[col[:-4]] = diverging_subset[col[:-4]].str.replace(
-                "<NA>", "", regex=False
-            )
-        if self.join_columns:
-            self._diverging_subset_df = diverging_subset[
-                join_columns + [col[:-4] for col in self._df1_intersect_cols]
-            ]
+        if not diverging_names:
+            # Short-circuit: no diverging columns, hence no diverging rows
+            self._diverging_subset_df = intersect_rows.iloc[:0][self.join_columns or []]
         else:
-            self._diverging_subset_df = diverging_subset[
-                [col[:-4] for col in self._df1_intersect_cols]
-            ]
+            mismatch_matrix = ~match_matrix[:, diverging_columns]
+            diverging_rows = mismatch_matrix.any(axis=1)
+            diverging_subset = intersect_rows.loc[diverging_rows, self._intersect_cols]
+            mismatch_matrix = mismatch_matrix[diverging_rows]
+            diff_columns = {}
+            for col, df1_col, df2_col, mismatch in zip(
+                diverging_names,
+                self._df1_intersect_cols,
+                self._df2_intersect_cols,
+                mismatch_matrix.T,
+            ):
+                df1_values = diverging_subset[df1_col]
+                df2_values = diverging_subset[df2_col]
+                # Skip the boolean indexing when every diverging row differs in this column
+                all_mismatch = mismatch.all()
+                if not all_mismatch:
+                    df1_values = df1_values[mismatch]
+                    df2_values = df2_values[mismatch]
+                formatted = (
+                    "{"
+                    + _to_str_array(df1_values)
+                    + "} --> {"
+                    + _to_str_array(df2_values)
+                    + "}"
+                )
+                if all_mismatch:
+                    diff_columns[col] = formatted
+                else:
+                    diverging_col = np.full(len(diverging_subset), np.nan, dtype=object)
+                    diverging_col[mismatch] = formatted
+                    diff_columns[col] = diverging_col
+            # pd.concat rather than DataFrame.assign, which reserves keyword names such as "self"
+            self._diverging_subset_df = pd.concat(
+                [
+                    diverging_subset[self.join_columns or []],
+                    pd.DataFrame(diff_columns, index=diverging_subset.index),
+                ],
+                axis=1,
+            )
 
-        # Unique columns and rows
-        if self.join_columns:
-            self._df1_unq_columns_df = self.df1[
-                self.join_columns + list(self._comparison_results.df1_unq_columns())
-            ]
-            self._df2_unq_columns_df = self.df2[
-                self.join_columns + list(self._comparison_results.df2_unq_columns())
-            ]
-        else:
-            self._df1_unq_columns_df = self.df1[
-                list(self._comparison_results.df1_unq_columns())
-            ]
-            self._df2_unq_columns_df = self.df2[
-                list(self._comparison_results.df2_unq_columns())
-            ]
+        # Unique rows
         self._df1_unq_rows_df = self._comparison_results.df1_unq_rows
         self._df2_unq_rows_df = self._comparison_results.df2_unq_rows
 
+    def _identical_compare(self) -> None:
+        """
+        Short-circuit for identical df1 and df2: sets empty comparison results without running datacompy.Compare.
+        datacompy.Compare is only run when the report or the intersect rows are requested (see _lazy_compare).
+        """
+        self._diverging_subset_df = self.df1.iloc[:0].loc[:, self.join_columns or []]
+        self._df1_unq_rows_df = self.df1.iloc[:0]
+        self._df2_unq_rows_df = self.df2.iloc[:0]
+
+    def _unq_columns(self, df: pd.DataFrame, other: pd.DataFrame) -> pd.DataFrame:
+        """
+        Projects df on the join columns and the columns missing from other.
+        Only needs the column names, so it does not run datacompy.Compare.
+        """
+        other_columns = set(other.columns)
+        return df.loc[
+            :,
+            (self.join_columns or [])
+            + [col for col in df.columns if col not in other_columns],
+        ]
+
+    def _identical(self) -> bool:
+        """
+        Checks once whether df1 and df2 are identical.
+        """
+        if self._is_identical is None:
+            self._is_identical = self.df1.shape == self.df2.shape and self.df1.equals(
+                self.df2
+            )
+        return self._is_identical
+
+    def _lazy_compare(self) -> None:
+        """
+        Runs datacompy.Compare and the enhanced compare once, on first access to their results.
+        Compares shallow copies of df1 and df2, since datacompy.Compare strips and temporarily adds columns to its inputs.
+        """
+        if self._comparison_results is None:
+            self._compare(self.df1.copy(deep=False), self.df2.copy(deep=False))
+            if not self._identical():
+                self._enhanced_compare()
+
+    def _lazy_enhanced_compare(self) -> None:
+        """
+        Builds the diverging subset and unique rows once, on first access.
+        Identical df1 and df2 short-circuit without running datacompy.Compare.
+        """
+        if self._diverging_subset_df is None:
+            if self._identical():
+                self._identical_compare()
+            else:
+                self._lazy_compare()
+
     def report(self, sample_count=10, column_count=10) -> str:
         """
         Returns datacompy.Compare report.
@@ -251,6 +576,7 @@ class Comparison:
             sample_count (int): The number of sample records to return in the report. Default = 10.
             column_count (int): The number of columns to display in the sample records output. Default = 10.
         """
+        self._lazy_compare()
         return self._comparison_results.report(
             sample_count=sample_count, column_count=column_count
         )
@@ -260,42 +586,50 @@ class Comparison:
         Returns a pandas DataFrame with the complete diverging subset of df1 and df2, showing only deltas.
         Formatting follows the rule: {df1} --> {df2}.
         """
+        self._lazy_enhanced_compare()
         return self._diverging_subset_df
 
     def df1_unq_columns(self) -> pd.DataFrame:
         """
         Returns a pandas DataFrame with join_columns (or index, if join_columns = None) and columns present only in df1.
         """
+        if self._df1_unq_columns_df is None:
+            self._df1_unq_columns_df = self._unq_columns(self.df1, self.df2)
         return self._df1_unq_columns_df
 
     def df2_unq_columns(self) -> pd.DataFrame:
         """
         Returns a pandas DataFrame with join_columns (or index, if join_columns = None) and columns present only in df2.
         """
+        if self._df2_unq_columns_df is None:
+            self._df2_unq_columns_df = self._unq_columns(self.df2, self.df1)
         return self._df2_unq_columns_df
 
     def df1_unq_rows(self) -> pd.DataFrame:
         """
         Returns a pandas DataFrame with the df1 subset that is unique to df1.
         """
+        self._lazy_enhanced_compare()
         return self._df1_unq_rows_df
 
     def df2_unq_rows(self) -> pd.DataFrame:
         """
         Returns a pandas DataFrame with the df2 subset that is unique to df2.
         """
+        self._lazy_enhanced_compare()
         return self._df2_unq_rows_df
 
-    def intersect_columns(self) -> OrderedSet:
+    def intersect_columns(self) -> list:
         """
-        Returns a set of columns present in both df1 and df2.
+        Returns a list of columns present in both df1 and df2.
         """
-        return OrderedSet(self.df1.columns) & OrderedSet(self.df2.columns)
+        return _ordered_intersect(self.df1.columns, self.df2.columns)
     
     def intersect_rows(self) -> pd.DataFrame:
         """
         Returns a pandas DataFrame with the subset of matching rows between df1 and df2.
         """
+        self._lazy_compare()
         return self._comparison_results.intersect_rows
 
     def report_to_txt(
@@ -317,7 +651,7 @@ class Comparison:
             file_name += ".txt"
         file_path = os.path.join(file_location, file_name)
         with open(file_path, "w", encoding=self.encoding) as file:
-            file.write(self._comparison_results.report(sample_count, column_count))
+            file.write(self.report(sample_count, column_count))
 
     def report_to_html(
         self,
@@ -341,34 +675,30 @@ class Comparison:
         if not file_name.endswith(".html"):
             file_name += ".html"
         file_path = os.path.join(file_location, file_name)
+        self._lazy_enhanced_compare()
+        html_table = self._diverging_subset_df.iloc[
+            :max_diverging_records, :max_diverging_columns
+        ]
+        # Column widths from the rendered cells only
         col_widths = []
-        for col in self._diverging_subset_df.columns:
-            col_max_length = self._diverging_subset_df[col].astype(str).str.len().max()
+        for col in html_table.columns:
+            col_max_length = html_table[col].astype(str).str.len().max()
             col_width = "auto" if col_max_length < 25 else "160px"
             col_widths.append(col_width)
-        html_table_rows = self._diverging_subset_df.index[:max_diverging_records]
-        html_table_cols = self._diverging_subset_df.columns[:max_diverging_columns]
-        html_table = self._diverging_subset_df.loc[html_table_rows, html_table_cols]
-        html_table = build_table(
-            html_table,
-            "grey_dark",
-            font_size="12px",
-            font_family="Monospace",
-            width_dict=col_widths,
-        )
+        html_table = _html_table(html_table, col_widths)
         html_report = (
-            self._comparison_results.report(sample_count, column_count)
+            self.report(sample_count, column_count)
             .replace("\n", "<br>")
             .replace(" ", "&nbsp;")
         )
-        html_report = f"<pre>{html_report}</pre>"
-        html_report = (
-            '<p style="font-size: 12.5px; font-family: Monospace;">TabularCompare Diverging Subset</p>'
-            + html_table
-            + html_report
-        )
         with open(file_path, "w", encoding=self.encoding) as file:
+            file.write(
+                '<p style="font-size: 12.5px; font-family: Monospace;">TabularCompare Diverging Subset</p>'
+            )
+            file.write(html_table)
+            file.write("<pre>")
             file.write(html_report)
+            file.write("</pre>")
 
     def report_to_xlsx(
         self,
@@ -387,7 +717,13 @@ class Comparison:
         if not file_name.endswith(".xlsx"):
             file_name += ".xlsx"
         file_path = os.path.join(file_location, file_name)
-        with pd.ExcelWriter(file_path) as writer:
+        self._lazy_enhanced_compare()
+        # Plain string cells: skips xlsxwriter's URL detection on every string
+        with pd.ExcelWriter(
+            file_path,
+            engine="xlsxwriter",
+            engine_kwargs={"options": {"strings_to_urls": False}},
+        ) as writer:
             if self.join_columns:
                 join_length = len(self.join_columns)
                 index = False
@@ -404,12 +740,12 @@ class Comparison:
             self._diverging_subset_df.to_excel(
                 writer, sheet_name="Changes", index=index
             )
-            if self._df1_unq_columns_df.shape[1] > join_length:
-                self._df1_unq_columns_df.to_excel(
+            if self.df1_unq_columns().shape[1] > join_length:
+                self.df1_unq_columns().to_excel(
                     writer, sheet_name=f"{self.df1_name}_unqCols"[:31], index=index
                 )
-            if self._df2_unq_columns_df.shape[1] > join_length:
-                self._df2_unq_columns_df.to_excel(
+            if self.df2_unq_columns().shape[1] > join_length:
+                self.df2_unq_columns().to_excel(
                     writer, sheet_name=f"{self.df2_name}_unqCols"[:31], index=index
                 )
             if self._df1_unq_rows_df.shape[0] > 0:
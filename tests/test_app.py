@@ -4,4 +4,52 @@ from click.testing import CliRunner
 def test_tabularcompare_cli():
     runner = CliRunner()
     result = runner.invoke(app.cli, ["--help"])
-    assert result.exit_code == 0
\ No newline at end of file
+    assert result.exit_code == 0
+
+def test_tabularcompare_cli_report_error(tmp_path, monkeypatch):
+    from tabularcompare import Comparison
+
+    def report_to_txt(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Comparison, "report_to_txt", report_to_txt)
+    (tmp_path / "df1.csv").write_text("id,value\n1,a\n2,b\n")
+    (tmp_path / "df2.csv").write_text("id,value\n1,a\n2,c\n")
+    runner = CliRunner()
+    result = runner.invoke(
+        app.cli,
+        [
+            str(tmp_path / "df1.csv"),
+            str(tmp_path / "df2.csv"),
+            "-c",
+            "id",
+            "--txt",
+            "-o",
+            str(tmp_path),
+        ],
+    )
+    assert isinstance(result.exception, SystemExit)
+    assert result.exit_code != 0
+    assert result.output.count("OSError: disk full") == 1
+
+
+def test_tabularcompare_cli_invalid_join_columns(tmp_path):
+    (tmp_path / "df1.csv").write_text("id,value\n1,a\n2,b\n")
+    (tmp_path / "df2.csv").write_text("id,value\n1,a\n2,c\n")
+    runner = CliRunner()
+    result = runner.invoke(
+        app.cli,
+        [
+            str(tmp_path / "df1.csv"),
+            str(tmp_path / "df2.csv"),
+            "-c",
+            "nope",
+            "--txt",
+            "--html",
+            "-o",
+            str(tmp_path),
+        ],
+    )
+    assert isinstance(result.exception, SystemExit)
+    assert result.exit_code != 0
+    assert result.output.count("df1 must have all columns from join_columns") == 1
@@ -3,170 +3,287 @@ import numpy as np
 import pandas as pd
 from tabularcompare import Comparison
 
-# Test parameters
-@pytest.fixture
-def create_test_data():
-    df1 = pd.DataFrame(
-        {"idx1": [1, 1, 2, 3, 3, 4],
-        "idx2": ["A", "B", "A", "A", "B", "A"],
-        "fname": ["Nikola", "Nikola", "Albert", "Stephen", "Stephen", "Steve"],
-        "lname": ["Tesla", "Tesla", "Einstein", "Hawking", "Hawking", "Jobs"],
-        "emptycol": [pd.NA for i in range(6)],
-        "email": ["em@tesla.com", "em@spacex.com", "ae@gmail.com", "sh@cam.uk", pd.NA, "sj@apple.com"],
-        "dob": ["1856-07-10", "1856-07-10", "1879-03-14", "1942-01-08", "1942-01-08", "1955-02-24"],
-        "active": [True, False, True, True, False, True]}
-    )
-    df1["dob"] = pd.to_datetime(df1["dob"])
-    df2 = pd.DataFrame(
-        {"idx1": [1, 1, 2, 3, 3, 2],
-        "idx2": ["A", "B", "A", "A", "B", "A"],
-        "fname": ["Nick", "Nick", "Albert", "Stephen", "Stephen", "Albert"],
-        "lname": ["Tesla", "Tesla", "Einstein", "Hawking", "Hawking", "Einstein"],
-        "emptycol": [pd.NA for i in range(6)],
-        "email": ["em@tesla.com", "em@spacex.com", "ae@gmail.com", "sh@cam.uk", pd.NA, "ae@hotmail.com"],
-        "dob": ["1856-07-10", pd.NA, "1879-03-14", "1942-03-08", "1942-01-08", "1879-03-14"],
-        "active": [True, False, True, True, False, pd.NA]}
-    )
-    df2["dob"] = pd.to_datetime(df2["dob"])
-    join_columns = ["idx1", "idx2"]
-    return df1, df2, join_columns
+# Expected results
+_EXPECTED_PARTIAL_REPORT = 'DataComPy Comparison\n--------------------\n\nDataFrame Summary\n-----------------\n\n  DataFrame  Columns  Rows\n0       df1        8     6\n1       df2        8     6\n\nColumn Summary\n--------------\n\nNumber of columns in common: 8\nNumber of columns in df1 but not in df2: 0\nNumber of columns in df2 but not in df1: 0\n\nRow Summary\n-----------\n\nMatched on: idx1, idx2\nAny duplicates on match values: Yes\nAbsolute Tolerance: 0\nRelative Tolerance: 0\nNumber of rows in common: 5\nNumber of rows in df1 but not in df2: 1\nNumber of rows in df2 but not in df1: 1\n\nNumber of rows with some compared columns unequal: 3\nNumber of rows with all compared columns equal: 2\n\nColumn Comparison\n-----------------\n\nNumber of columns compared with some values unequal: 2\nNumber of columns compared with all values equal: 6\nTotal number of values which compare unequal: 4\n\nColumns with Unequal Values or Types\n------------------------------------'
 
-def test_report(create_test_data: tuple):
-    expected_partial_report = 'DataComPy Comparison\n--------------------\n\nDataFrame Summary\n-----------------\n\n  DataFrame  Columns  Rows\n0       df1        8     6\n1       df2        8     6\n\nColumn Summary\n--------------\n\nNumber of columns in common: 8\nNumber of columns in df1 but not in df2: 0\nNumber of columns in df2 but not in df1: 0\n\nRow Summary\n-----------\n\nMatched on: idx1, idx2\nAny duplicates on match values: Yes\nAbsolute Tolerance: 0\nRelative Tolerance: 0\nNumber of rows in common: 5\nNumber of rows in df1 but not in df2: 1\nNumber of rows in df2 but not in df1: 1\n\nNumber of rows with some compared columns unequal: 3\nNumber of rows with all compared columns equal: 2\n\nColumn Comparison\n-----------------\n\nNumber of columns compared with some values unequal: 2\nNumber of columns compared with all values equal: 6\nTotal number of values which compare unequal: 4\n\nColumns with Unequal Values or Types\n------------------------------------'
-    df1, df2, join_columns = create_test_data
-    comparison = Comparison(df1, df2, join_columns)
-    report = comparison.report()
-    assert expected_partial_report in report
-
-def test_diverging_subset(create_test_data: tuple):
-    expected_diverging_subset = pd.DataFrame(
+_EXPECTED_DIVERGING_SUBSET = pd.DataFrame(
     {'idx1': {0: 1, 1: 1, 3: 3},
      'idx2': {0: 'A', 1: 'B', 3: 'A'},
      'fname': {0: '{Nikola} --> {Nick}', 1: '{Nikola} --> {Nick}', 3: np.nan},
      'dob': {0: np.nan,
              1: '{1856-07-10} --> {NaT}',
              3: '{1942-01-08} --> {1942-03-08}'}}
-    )
-    df1, df2, join_columns = create_test_data
-    comparison = Comparison(df1, df2, join_columns)
-    diverging_subset = comparison.diverging_subset()
-    assert diverging_subset.equals(expected_diverging_subset)
+)
 
-def test_df1_unq_columns(create_test_data: tuple):
-    expected_df1_unq_columns = pd.DataFrame(
+_EXPECTED_DF1_UNQ_COLUMNS = pd.DataFrame(
     {'idx1': {0: 1, 1: 1, 2: 2, 3: 3, 4: 3, 5: 4},
      'idx2': {0: 'A', 1: 'B', 2: 'A', 3: 'A', 4: 'B', 5: 'A'}}
-    )
-    df1, df2, join_columns = create_test_data
-    comparison = Comparison(df1, df2, join_columns)
-    df1_unq_columns = comparison.df1_unq_columns()
-    assert df1_unq_columns.equals(expected_df1_unq_columns)
+)
 
-def test_df2_unq_columns(create_test_data: tuple):
-    expected_df2_unq_columns = pd.DataFrame(
+_EXPECTED_DF2_UNQ_COLUMNS = pd.DataFrame(
     {'idx1': {0: 1, 1: 1, 2: 2, 3: 3, 4: 3, 5: 2},
      'idx2': {0: 'A', 1: 'B', 2: 'A', 3: 'A', 4: 'B', 5: 'A'}}
-    )
-    df1, df2, join_columns = create_test_data
-    comparison = Comparison(df1, df2, join_columns)
-    df2_unq_columns = comparison.df2_unq_columns()
-    assert df2_unq_columns.equals(expected_df2_unq_columns)
+)
 
-def test_df1_unq_rows(create_test_data: tuple):
-    expected_df1_unq_rows = pd.DataFrame(
+_EXPECTED_DF1_UNQ_ROWS = pd.DataFrame(
     {'idx1': {5: 4},
      'idx2': {5: 'A'},
      'fname': {5: 'Steve'},
      'lname': {5: 'Jobs'},
-     'emptycol': {5: ""},
+     'emptycol': {5: pd.NA},
      'email': {5: 'sj@apple.com'},
      'dob': {5: pd.Timestamp('1955-02-24 00:00:00')},
      'active': {5: True}}
-    )
-    df1, df2, join_columns = create_test_data
-    comparison = Comparison(df1, df2, join_columns)
-    df1_unq_rows = comparison.df1_unq_rows().fillna("")
-    assert df1_unq_rows.equals(expected_df1_unq_rows)
+).astype({'active': 'object'})
 
-def test_df2_unq_rows(create_test_data: tuple):
-    expected_df2_unq_rows = pd.DataFrame(
+_EXPECTED_DF2_UNQ_ROWS = pd.DataFrame(
     {'idx1': {6: 2},
      'idx2': {6: 'A'},
      'fname': {6: 'Albert'},
      'lname': {6: 'Einstein'},
-     'emptycol': {6: ""},
+     'emptycol': {6: pd.NA},
      'email': {6: 'ae@hotmail.com'},
      'dob': {6: pd.Timestamp('1879-03-14 00:00:00')},
-     'active': {6: ""}}
+     'active': {6: pd.NA}}
+)
+
+_EXPECTED_INTERSECT_COLUMNS = ['idx1', 'idx2', 'fname', 'lname', 'emptycol', 'email', 'dob', 'active']
+
+_EXPECTED_INTERSECT_ROWS = pd.DataFrame({
+    'idx1': {0: 1, 1: 1, 2: 2, 3: 3, 4: 3},
+    'idx2': {0: 'A', 1: 'B', 2: 'A', 3: 'A', 4: 'B'},
+    'fname_df1': {0: 'Nikola',
+    1: 'Nikola',
+    2: 'Albert',
+    3: 'Stephen',
+    4: 'Stephen'},
+    'lname_df1': {0: 'Tesla',
+    1: 'Tesla',
+    2: 'Einstein',
+    3: 'Hawking',
+    4: 'Hawking'},
+    'emptycol_df1': {0: pd.NA, 1: pd.NA, 2: pd.NA, 3: pd.NA, 4: pd.NA},
+    'email_df1': {0: 'em@tesla.com',
+    1: 'em@spacex.com',
+    2: 'ae@gmail.com',
+    3: 'sh@cam.uk',
+    4: pd.NA},
+    'dob_df1': {0: pd.Timestamp('1856-07-10 00:00:00'),
+    1: pd.Timestamp('1856-07-10 00:00:00'),
+    2: pd.Timestamp('1879-03-14 00:00:00'),
+    3: pd.Timestamp('1942-01-08 00:00:00'),
+    4: pd.Timestamp('1942-01-08 00:00:00')},
+    'active_df1': {0: True, 1: False, 2: True, 3: True, 4: False},
+    'fname_df2': {0: 'Nick', 1: 'Nick', 2: 'Albert', 3: 'Stephen', 4: 'Stephen'},
+    'lname_df2': {0: 'Tesla',
+    1: 'Tesla',
+    2: 'Einstein',
+    3: 'Hawking',
+    4: 'Hawking'},
+    'emptycol_df2': {0: pd.NA, 1: pd.NA, 2: pd.NA, 3: pd.NA, 4: pd.NA},
+    'email_df2': {0: 'em@tesla.com',
+    1: 'em@spacex.com',
+    2: 'ae@gmail.com',
+    3: 'sh@cam.uk',
+    4: pd.NA},
+    'dob_df2': {0: pd.Timestamp('1856-07-10 00:00:00'),
+    1: pd.NaT,
+    2: pd.Timestamp('1879-03-14 00:00:00'),
+    3: pd.Timestamp('1942-03-08 00:00:00'),
+    4: pd.Timestamp('1942-01-08 00:00:00')},
+    'active_df2': {0: True, 1: False, 2: True, 3: True, 4: False},
+    '_merge': {0: 'both', 1: 'both', 2: 'both', 3: 'both', 4: 'both'},
+    'fname_match': {0: False, 1: False, 2: True, 3: True, 4: True},
+    'lname_match': {0: True, 1: True, 2: True, 3: True, 4: True},
+    'emptycol_match': {0: True, 1: True, 2: True, 3: True, 4: True},
+    'email_match': {0: True, 1: True, 2: True, 3: True, 4: True},
+    'dob_match': {0: True, 1: False, 2: True, 3: False, 4: True},
+    'active_match': {0: True, 1: True, 2: True, 3: True, 4: True}
+}).astype({
+    'active_df1': 'object',
+    'active_df2': 'object',
+    '_merge': pd.CategoricalDtype(['left_only', 'right_only', 'both'])
+})
+
+def _assert_frame_eq(result: pd.DataFrame, expected: pd.DataFrame):
+    """
+    Compares frames column by column, checking dtypes,
+    with missing values (NaN, NaT, None, pd.NA) comparing equal.
+    """
+    assert list(result.columns) == list(expected.columns)
+    assert result.index.equals(expected.index)
+    for col in expected.columns:
+        assert result[col].dtype == expected[col].dtype, col
+        values, expected_values = result[col].to_numpy(), expected[col].to_numpy()
+        if expected_values.dtype.kind in "fMm":
+            assert np.array_equal(values, expected_values, equal_nan=True), col
+        else:
+            missing, expected_missing = pd.isna(values), pd.isna(expected_values)
+            assert (missing == expected_missing).all(), col
+            assert (values[~missing] == expected_values[~expected_missing]).all(), col
+
+# Test parameters
+@pytest.fixture(scope="session")
+def create_test_data():
+    df1 = pd.DataFrame(
+        {"idx1": np.array([1, 1, 2, 3, 3, 4], dtype="int64"),
+        "idx2": np.array(["A", "B", "A", "A", "B", "A"], dtype="object"),
+        "fname": np.array(["Nikola", "Nikola", "Albert", "Stephen", "Stephen", "Steve"], dtype="object"),
+        "lname": np.array(["Tesla", "Tesla", "Einstein", "Hawking", "Hawking", "Jobs"], dtype="object"),
+        "emptycol": pd.array([pd.NA] * 6, dtype="object"),
+        "email": np.array(["em@tesla.com", "em@spacex.com", "ae@gmail.com", "sh@cam.uk", pd.NA, "sj@apple.com"], dtype="object"),
+        "dob": np.array(["1856-07-10", "1856-07-10", "1879-03-14", "1942-01-08", "1942-01-08", "1955-02-24"], dtype="datetime64[ns]"),
+        "active": np.array([True, False, True, True, False, True], dtype="bool")}
     )
+    df2 = pd.DataFrame(
+        {"idx1": np.array([1, 1, 2, 3, 3, 2], dtype="int64"),
+        "idx2": np.array(["A", "B", "A", "A", "B", "A"], dtype="object"),
+        "fname": np.array(["Nick", "Nick", "Albert", "Stephen", "Stephen", "Albert"], dtype="object"),
+        "lname": np.array(["Tesla", "Tesla", "Einstein", "Hawking", "Hawking", "Einstein"], dtype="object"),
+        "emptycol": pd.array([pd.NA] * 6, dtype="object"),
+        "email": np.array(["em@tesla.com", "em@spacex.com", "ae@gmail.com", "sh@cam.uk", pd.NA, "ae@hotmail.com"], dtype="object"),
+        "dob": np.array(["1856-07-10", "NaT", "1879-03-14", "1942-03-08", "1942-01-08", "1879-03-14"], dtype="datetime64[ns]"),
+        "active": np.array([True, False, True, True, False, pd.NA], dtype="object")}
+    )
+    join_columns = ["idx1", "idx2"]
+    return df1, df2, join_columns
+
+@pytest.fixture(scope="session")
+def comparison(create_test_data: tuple):
     df1, df2, join_columns = create_test_data
-    comparison = Comparison(df1, df2, join_columns)
-    df2_unq_rows = comparison.df2_unq_rows().fillna("")
-    assert df2_unq_rows.equals(expected_df2_unq_rows)
+    return Comparison(df1, df2, join_columns)
+
+def test_report(comparison: Comparison):
+    report = comparison.report()
+    assert report.startswith(_EXPECTED_PARTIAL_REPORT)
+
+@pytest.mark.parametrize("accessor, expected", [
+    ("diverging_subset", _EXPECTED_DIVERGING_SUBSET),
+    ("df1_unq_columns", _EXPECTED_DF1_UNQ_COLUMNS),
+    ("df2_unq_columns", _EXPECTED_DF2_UNQ_COLUMNS),
+    ("intersect_columns", _EXPECTED_INTERSECT_COLUMNS),
+])
+def test_accessor(comparison: Comparison, accessor: str, expected):
+    result = getattr(comparison, accessor)()
+    if isinstance(expected, list):
+        assert result == expected
+    else:
+        assert result.equals(expected)
+
+def test_df1_unq_rows(comparison: Comparison):
+    _assert_frame_eq(comparison.df1_unq_rows(), _EXPECTED_DF1_UNQ_ROWS)
+
+def test_df2_unq_rows(comparison: Comparison):
+    _assert_frame_eq(comparison.df2_unq_rows(), _EXPECTED_DF2_UNQ_ROWS)
 
-def test_intersect_columns(create_test_data: tuple):
-    expected_intersect_columns = ['idx1', 'idx2', 'fname', 'lname', 'emptycol', 'email', 'dob', 'active']
+def test_intersect_rows(comparison: Comparison):
+    _assert_frame_eq(comparison.intersect_rows(), _EXPECTED_INTERSECT_ROWS)
+
+def test_ignore_columns(create_test_data: tuple):
+    expected_intersect_columns = ['idx1', 'idx2', 'fname', 'lname', 'email', 'dob', 'active']
     df1, df2, join_columns = create_test_data
-    comparison = Comparison(df1, df2, join_columns)
+    comparison = Comparison(df1, df2, join_columns, ignore_columns=["emptycol", "missingcol"])
     intersect_columns = comparison.intersect_columns()
     assert intersect_columns == expected_intersect_columns
+    assert "emptycol" in df1.columns and "emptycol" in df2.columns
+
+def test_identical(create_test_data: tuple):
+    df1, _, join_columns = create_test_data
+    comparison = Comparison(df1, df1.copy(), join_columns)
+    assert comparison.diverging_subset().empty
+    assert comparison.df1_unq_rows().empty
+    assert comparison.df2_unq_rows().empty
+    assert "Number of rows with all compared columns equal: 6" in comparison.report()
+
+def test_fast_path(create_test_data: tuple):
+    df1, df2, join_columns = create_test_data
+    df2 = df2.drop(index=5)
+    comparison = Comparison(df1.copy(), df2.copy(), join_columns)
+    fast_comparison = Comparison(df1.copy(), df2.copy(), join_columns, fast_path=True)
+    assert fast_comparison.diverging_subset().equals(comparison.diverging_subset())
+    assert fast_comparison.df1_unq_rows().index.equals(comparison.df1_unq_rows().index)
+    assert fast_comparison.intersect_rows().index.equals(comparison.intersect_rows().index)
+
+def test_fast_path_sorted_keys():
+    df1 = pd.DataFrame({"id": [1, 2, 4, 5, 7], "value": [1.0, 2.0, 4.0, 5.0, 7.0]})
+    df2 = pd.DataFrame({"id": [0, 2, 4, 6, 7, 8], "value": [0.0, 2.0, 4.5, 6.0, 7.0, 8.0]})
+    comparison = Comparison(df1.copy(), df2.copy(), "id")
+    fast_comparison = Comparison(df1.copy(), df2.copy(), "id", fast_path=True)
+    assert fast_comparison.diverging_subset().equals(comparison.diverging_subset())
+    assert fast_comparison.df1_unq_rows().equals(comparison.df1_unq_rows())
+    assert fast_comparison.df2_unq_rows().index.equals(comparison.df2_unq_rows().index)
+    assert fast_comparison.intersect_rows().index.equals(comparison.intersect_rows().index)
+
+def test_inputs_not_mutated(create_test_data: tuple):
+    df1, df2, join_columns = create_test_data
+    df1 = df1.assign(score=[1.0, np.nan, 3.0, 4.0, 5.0, 6.0])
+    df2 = df2.assign(score=[1.0, 2.0, np.nan, 4.0, 5.0, 6.0])
+    df1_before, df2_before = df1.copy(), df2.copy()
+    comparison = Comparison(df1, df2, join_columns, ignore_spaces=True)
+    comparison.diverging_subset()
+    comparison.report()
+    pd.testing.assert_frame_equal(df1, df1_before)
+    pd.testing.assert_frame_equal(df2, df2_before)
+
+def test_literal_nan_strings():
+    df1 = pd.DataFrame({"id": [1, 2, 3], "value": ["nan", "a", None], "score": [1.0, np.nan, 3.0]})
+    df2 = pd.DataFrame({"id": [1, 2, 3], "value": ["b", "<NA>", "c"], "score": [1.5, 2.5, 3.0]})
+    comparison = Comparison(df1, df2, "id")
+    diverging_subset = comparison.diverging_subset()
+    assert diverging_subset["value"].tolist() == ["{nan} --> {b}", "{a} --> {<NA>}", "{None} --> {c}"]
+    assert diverging_subset["score"].tolist()[:2] == ["{1} --> {1.5}", "{} --> {2.5}"]
+
+def test_reserved_column_names():
+    df1 = pd.DataFrame({"id": [1, 2], "self": ["a", "b"]})
+    df2 = pd.DataFrame({"id": [1, 2], "self": ["a", "c"]})
+    comparison = Comparison(df1, df2, "id")
+    assert comparison.diverging_subset()["self"].tolist() == ["{b} --> {c}"]
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([1.0, 2.0, np.nan, -3.0]),
+        np.array([1.0, np.inf, 2.0]),
+        np.array([-np.inf, 1.0]),
+        np.array([1.0, 2.5, np.nan]),
+        np.array([np.nan, np.nan]),
+        np.array([1.0, 2.0, np.nan], dtype=np.float32),
+        np.array([0.5, 1.0], dtype=np.float32),
+        np.array([1.0, 2.0, np.nan], dtype=np.float16),
+        np.array([0.5, np.inf], dtype=np.float16),
+    ],
+)
+def test_integer_valued_kernel(monkeypatch, values: np.ndarray):
+    pytest.importorskip("numba")
+    from tabularcompare import core
+    column = pd.Series(values)
+    expected = core._is_integer_valued(column)
+    monkeypatch.setattr(core, "_NUMBA_MIN_SIZE", 0)
+    assert core._integer_valued_kernel() is not None
+    assert core._is_integer_valued(column) == expected
+
+def test_invalid_join_columns(create_test_data: tuple):
+    df1, _, _ = create_test_data
+    with pytest.raises(ValueError, match="df1 must have all columns from join_columns"):
+        Comparison(df1, df1.copy(), "nope")
+    with pytest.raises(ValueError, match="df2 must have all columns from join_columns"):
+        Comparison(df1, df1.drop(columns="idx2"), ["idx1", "idx2"])
+    with pytest.raises(Exception, match="Only provide on_index or join_columns"):
+        Comparison(df1, df1.copy(), ["idx1", "idx2"], on_index=True)
+
+def test_html_table_empty():
+    from tabularcompare.core import _html_table
+    assert _html_table(pd.DataFrame({"id": []}), ["30px"]) == ""
+    assert _html_table(pd.DataFrame({"id": [1]}), ["30px"]).startswith("<style>")
 
-def test_intersect_rows(create_test_data: tuple):
-    expected_intersect_rows = pd.DataFrame({
-        'idx1': {0: 1, 1: 1, 2: 2, 3: 3, 4: 3},
-        'idx2': {0: 'A', 1: 'B', 2: 'A', 3: 'A', 4: 'B'},
-        'fname_df1': {0: 'Nikola',
-        1: 'Nikola',
-        2: 'Albert',
-        3: 'Stephen',
-        4: 'Stephen'},
-        'lname_df1': {0: 'Tesla',
-        1: 'Tesla',
-        2: 'Einstein',
-        3: 'Hawking',
-        4: 'Hawking'},
-        'emptycol_df1': {0: '', 1: '', 2: '', 3: '', 4: ''},
-        'email_df1': {0: 'em@tesla.com',
-        1: 'em@spacex.com',
-        2: 'ae@gmail.com',
-        3: 'sh@cam.uk',
-        4: ''},
-        'dob_df1': {0: pd.Timestamp('1856-07-10 00:00:00'),
-        1: pd.Timestamp('1856-07-10 00:00:00'),
-        2: pd.Timestamp('1879-03-14 00:00:00'),
-        3: pd.Timestamp('1942-01-08 00:00:00'),
-        4: pd.Timestamp('1942-01-08 00:00:00')},
-        'active_df1': {0: True, 1: False, 2: True, 3: True, 4: False},
-        'fname_df2': {0: 'Nick', 1: 'Nick', 2: 'Albert', 3: 'Stephen', 4: 'Stephen'},
-        'lname_df2': {0: 'Tesla',
-        1: 'Tesla',
-        2: 'Einstein',
-        3: 'Hawking',
-        4: 'Hawking'},
-        'emptycol_df2': {0: '', 1: '', 2: '', 3: '', 4: ''},
-        'email_df2': {0: 'em@tesla.com',
-        1: 'em@spacex.com',
-        2: 'ae@gmail.com',
-        3: 'sh@cam.uk',
-        4: ''},
-        'dob_df2': {0: pd.Timestamp('1856-07-10 00:00:00'),
-        1: pd.Timestamp('2000-01-01 00:00:00'),
-        2: pd.Timestamp('1879-03-14 00:00:00'),
-        3: pd.Timestamp('1942-03-08 00:00:00'),
-        4: pd.Timestamp('1942-01-08 00:00:00')},
-        'active_df2': {0: True, 1: False, 2: True, 3: True, 4: False},
-        '_merge': {0: 'both', 1: 'both', 2: 'both', 3: 'both', 4: 'both'},
-        'fname_match': {0: False, 1: False, 2: True, 3: True, 4: True},
-        'lname_match': {0: True, 1: True, 2: True, 3: True, 4: True},
-        'emptycol_match': {0: True, 1: True, 2: True, 3: True, 4: True},
-        'email_match': {0: True, 1: True, 2: True, 3: True, 4: True},
-        'dob_match': {0: True, 1: False, 2: True, 3: False, 4: True},
-        'active_match': {0: True, 1: True, 2: True, 3: True, 4: True}
-    })
+def test_pickle(create_test_data: tuple):
+    import pickle
     df1, df2, join_columns = create_test_data
     comparison = Comparison(df1, df2, join_columns)
-    intersect_rows = comparison.intersect_rows().fillna("")
-    dtime_cols = intersect_rows.select_dtypes(include=['datetime'])
-    intersect_rows[dtime_cols.columns] = dtime_cols.fillna(pd.to_datetime('2000-01-01'))
-    intersect_rows["_merge"] = intersect_rows["_merge"].astype("object")
-    assert intersect_rows.equals(expected_intersect_rows)
\ No newline at end of file
+    # Before and after the lazy comparison has run
+    unpickled = pickle.loads(pickle.dumps(comparison))
+    assert unpickled.report().startswith(_EXPECTED_PARTIAL_REPORT)
+    comparison.diverging_subset()
+    unpickled = pickle.loads(pickle.dumps(comparison))
+    assert unpickled.diverging_subset().equals(comparison.diverging_subset())
+    assert unpickled.report().startswith(_EXPECTED_PARTIAL_REPORT)